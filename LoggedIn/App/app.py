@@ -1,148 +1,247 @@
 import os
+import re
 import time
 import sys
 import random
 import datetime
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
 import numpy as np
-from collections import Counter, defaultdict
-from matplotlib.ticker import MaxNLocator
+from collections import Counter, defaultdict, deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+try:
+    import pandas as pd
+except ImportError:  # pandas is optional; only LogStorage.as_dataframe needs it
+    pd = None
 
 # Add the current directory to the Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+# Reference point for integer epoch seconds (naive, like the parsed timestamps)
+_EPOCH = datetime.datetime(1970, 1, 1)
+_ONE_SECOND = datetime.timedelta(seconds=1)
+
+# KEY=VALUE tokens: key runs up to the first '=', value to the next whitespace
+_KV_RE = re.compile(r'([^\s=]*)=(\S*)')
+
+# Known suspicious account name fragments, matched in a single scan per user
+_SUSPICIOUS_RE = re.compile(r'hacker|admin|root|test|guest')
+
+# Files larger than this are parsed in worker processes, in chunks of lines
+_PARALLEL_PARSE_BYTES = 10_000_000
+_PARSE_CHUNK_LINES = 10_000
+
+class LogRecord(namedtuple('LogRecord', 'event_id time_created computer user extras')):
+    """A parsed log line: the common fields by position, any others in extras."""
+    __slots__ = ()
+    
+    def as_dict(self):
+        """Return the record as a KEY=VALUE mapping, as it appeared in the log."""
+        data = {key: value for key, value in zip(
+            ('EventID', 'TimeCreated', 'Computer', 'User'), self[:4]
+        ) if value is not None}
+        data.update(self.extras)
+        return data
+
+def _parse_log_line(line):
+    """Parse a log line into a LogRecord, or return None."""
+    # Tokens never contain whitespace, so lines need no strip() first
+    if '=' not in line:  # Blank, header or continuation line
+        return None
+    fields = dict(_KV_RE.findall(line))
+    if not fields:
+        return None
+    pop = fields.pop
+    return LogRecord(pop('EventID', None), pop('TimeCreated', None),
+                     pop('Computer', None), pop('User', None), fields)
+
 class LogParser:
     def parse_line(self, line):
         """Parse a log line into structured data."""
-        parts = line.split()
-        parsed_data = {}
-        
-        for part in parts:
-            if '=' in part:
-                key, value = part.split('=', 1)
-                parsed_data[key] = value
-                
-        return parsed_data if parsed_data else None
+        return _parse_log_line(line)
 
 class LogStorage:
     def __init__(self, db_path=None):
         """Initialize storage for logs."""
         self.logs = []
         self.db_path = db_path
+        self._frame = None
         
     def store_log(self, log_entry):
         """Store a log entry."""
         self.logs.append(log_entry)
         
+    def extend_logs(self, entries):
+        """Store many log entries from any iterable."""
+        self.logs.extend(entries)
+        
     def get_logs(self):
         """Retrieve all logs."""
         return self.logs
         
+    def as_dataframe(self):
+        """Return the core log fields as a DataFrame, cached until more logs are stored."""
+        if self._frame is None or len(self._frame) != len(self.logs):
+            # Column-wise construction is far cheaper than inferring a frame from the dicts
+            df = pd.DataFrame({
+                column: [log[index] for log in self.logs]
+                for index, column in enumerate(('EventID', 'TimeCreated', 'Computer', 'User'))
+            })
+            # Parse every TimeCreated once; malformed values become NaT
+            df['timestamp'] = pd.to_datetime(df['TimeCreated'], format='%Y%m%dT%H%M%SZ', errors='coerce')
+            self._frame = df
+        return self._frame
+        
     def close(self):
         """Close any open connections."""
         pass
 
+def _parse_time_created(time_str):
+    """Parse a fixed-width YYYYMMDDTHHMMSSZ timestamp, or return None."""
+    # Slicing avoids strptime re-parsing the format string on every call
+    # int() alone would accept signs and padding such as '+023' or ' 1'
+    if (len(time_str) == 16 and time_str[8] == 'T' and time_str[15] == 'Z'
+            and time_str[:8].isdigit() and time_str[9:15].isdigit()):
+        try:
+            return datetime.datetime(
+                int(time_str[0:4]), int(time_str[4:6]), int(time_str[6:8]),
+                int(time_str[9:11]), int(time_str[11:13]), int(time_str[13:15])
+            )
+        except ValueError:
+            pass  # Invalid timestamp values
+    return None
+
+class TimelineEvent:
+    """A login event on the timeline."""
+    __slots__ = ('timestamp', 'event_type', 'user', 'computer')
+    
+    def __init__(self, timestamp, event_type, user, computer):
+        self.timestamp = timestamp
+        self.event_type = event_type
+        self.user = user
+        self.computer = computer
+
 class LogAnalyser:
     def __init__(self, storage):
         """Initialize with a storage instance."""
         self.storage = storage
+        # Analysis state is rebuilt whenever the stored log count changes
+        self._indexed_count = None
+        
+    def invalidate(self):
+        """Discard cached analysis state so it is rebuilt on next use."""
+        self._indexed_count = None
+        
+    def _ensure_indexes(self):
+        """Build the analysis state if it is missing or out of date."""
+        if self._indexed_count != len(self.storage.get_logs()):
+            self._build_indexes()
+        
+    def _build_indexes(self):
+        """Scan the stored logs once and precompute all analysis state."""
+        logs = self.storage.get_logs()
+        
+        # Per-log columns
+        self._event_ids = event_ids = []
+        self._users = users = []
+        self._computers = computers = []
+        self._timestamps = timestamps = []
+        
+        # Aggregates
+        self._user_to_computers = user_to_computers = defaultdict(set)
+        self._timeline = timeline = []
+        failed_times = defaultdict(list)
+        
+        for event_id, time_created, computer, user, _ in logs:
+            if user is None:
+                user = 'unknown'
+            if computer is None:
+                computer = 'unknown'
+            dt = _parse_time_created(time_created) if time_created else None
+            
+            event_ids.append(event_id)
+            users.append(user)
+            computers.append(computer)
+            timestamps.append(dt)
+            
+            if dt is not None and event_id in ('4624', '4625'):  # Login events
+                timeline.append(TimelineEvent(
+                    dt, 'Success' if event_id == '4624' else 'Failure', user, computer
+                ))
+                user_to_computers[user].add(computer)
+                if event_id == '4625':
+                    failed_times[user].append((dt - _EPOCH) // _ONE_SECOND)
+        
+        # Counting over the collected columns runs in C rather than per-log +=
+        self._event_counts = Counter(event_ids)
+        self._user_activity = Counter(users)
+        self._computer_activity = Counter(computers)
+        self._failed_by_user = Counter(
+            user for event_id, user in zip(event_ids, users) if event_id == '4625'
+        )
+        self._hour_counts = Counter(event.timestamp.hour for event in timeline)
+        
+        # Sorted epoch seconds of each user's failed logins, for window checks
+        self._failed_times_by_user = {
+            user: np.sort(np.array(times, dtype=np.int64))
+            for user, times in failed_times.items()
+        }
+        self._indexed_count = len(logs)
         
     def count_failed_logins(self):
         """Count failed login attempts by user."""
-        failed_logins = Counter()
-        
-        for log in self.storage.get_logs():
-            if log.get('EventID') == '4625':  # Failed login
-                user = log.get('User', 'unknown')
-                failed_logins[user] += 1
-                
-        return [(user, count) for user, count in failed_logins.items() if count > 0]
+        self._ensure_indexes()
+        return list(self._failed_by_user.items())
     
     def get_login_timeline(self):
         """Get login events with timestamps for timeline analysis."""
-        timeline = []
-        
-        for log in self.storage.get_logs():
-            if log.get('EventID') in ['4624', '4625']:  # Login events
-                time_str = log.get('TimeCreated', '')
-                if time_str:
-                    try:
-                        # Convert TimeCreated format to datetime
-                        dt = datetime.datetime.strptime(time_str, '%Y%m%dT%H%M%SZ')
-                        timeline.append({
-                            'timestamp': dt,
-                            'event_type': 'Success' if log.get('EventID') == '4624' else 'Failure',
-                            'user': log.get('User', 'unknown'),
-                            'computer': log.get('Computer', 'unknown')
-                        })
-                    except ValueError:
-                        pass  # Skip entries with invalid timestamp format
-                        
-        return timeline
+        self._ensure_indexes()
+        return self._timeline
     
     def detect_brute_force(self, threshold=3, time_window_minutes=10):
         """Detect potential brute force attacks."""
-        timeline = self.get_login_timeline()
-        failed_attempts = defaultdict(list)
-        
-        # Group failed logins by user
-        for event in timeline:
-            if event['event_type'] == 'Failure':
-                failed_attempts[event['user']].append(event['timestamp'])
+        self._ensure_indexes()
+        window_seconds = time_window_minutes * 60
         
         # Detect rapid sequences of failures
         brute_force = {}
-        for user, timestamps in failed_attempts.items():
-            if len(timestamps) >= threshold:
-                # Sort timestamps
-                sorted_times = sorted(timestamps)
-                
-                # Check for threshold failures within time window
-                for i in range(len(sorted_times) - threshold + 1):
-                    time_diff = (sorted_times[i + threshold - 1] - sorted_times[i]).total_seconds() / 60
-                    if time_diff <= time_window_minutes:
-                        brute_force[user] = len(timestamps)
-                        break
+        for user, times in self._failed_times_by_user.items():
+            count = len(times)
+            if count >= threshold:
+                # Span of every run of `threshold` consecutive failures
+                spans = times[threshold - 1:] - times[:count - threshold + 1]
+                if (spans <= window_seconds).any():
+                    brute_force[user] = count
                         
         return brute_force
     
     def detect_suspicious_users(self):
         """Detect suspicious user accounts."""
-        suspicious = set()
-        known_suspicious_patterns = ['hacker', 'admin', 'root', 'test', 'guest']
-        
-        for log in self.storage.get_logs():
-            user = log.get('User', '').lower()
-            # Check for suspicious patterns
-            for pattern in known_suspicious_patterns:
-                if pattern in user and user != 'backup_admin':  # Exclude admin accounts
-                    suspicious.add(log.get('User'))
-                    break
+        self._ensure_indexes()
+        suspicious = []
+        
+        # Each distinct user is checked once rather than once per log
+        for user in self._user_activity:
+            user_lower = user.lower()
+            # Exclude admin accounts
+            if _SUSPICIOUS_RE.search(user_lower) and not user_lower.startswith('backup_admin'):
+                suspicious.append(user)
                     
-        return list(suspicious)
+        return suspicious
     
     def detect_unusual_activity(self):
         """Detect unusual login patterns and activity."""
-        timeline = self.get_login_timeline()
-        
-        # Group logins by hour to detect unusual timing
-        hour_counts = defaultdict(int)
-        user_computers = defaultdict(set)
+        self._ensure_indexes()
+        hour_counts = self._hour_counts
         unusual_activity = []
         
-        for event in timeline:
-            hour = event['timestamp'].hour
-            hour_counts[hour] += 1
-            user_computers[event['user']].add(event['computer'])
-        
         # Detect logins during unusual hours (midnight to 5am)
         unusual_hours = [h for h in range(0, 5) if hour_counts[h] > 0]
         if unusual_hours:
             unusual_activity.append(f"Unusual login hours detected: {', '.join(map(str, unusual_hours))}:00")
         
         # Detect users logging in from multiple computers
-        for user, computers in user_computers.items():
+        for user, computers in self._user_to_computers.items():
             if len(computers) > 2:  # Arbitrary threshold
                 unusual_activity.append(f"User {user} logged in from multiple computers: {', '.join(computers)}")
                 
@@ -150,37 +249,26 @@ class LogAnalyser:
     
     def get_event_statistics(self):
         """Get statistics about different event types."""
-        event_counts = Counter()
-        computer_activity = Counter()
-        user_activity = Counter()
-        
-        for log in self.storage.get_logs():
-            event_id = log.get('EventID')
-            computer = log.get('Computer', 'unknown')
-            user = log.get('User', 'unknown')
-            
-            event_counts[event_id] += 1
-            computer_activity[computer] += 1
-            user_activity[user] += 1
-            
+        self._ensure_indexes()
         return {
-            'event_counts': dict(event_counts),
-            'computer_activity': dict(computer_activity),
-            'user_activity': dict(user_activity)
+            'event_counts': dict(self._event_counts),
+            'computer_activity': dict(self._computer_activity),
+            'user_activity': dict(self._user_activity)
         }
 
 class LogView:
     @staticmethod
     def plot_failed_logins(analyser):
         """Plot failed login attempts."""
-        failed_logins = analyser.count_failed_logins()
+        import matplotlib.pyplot as plt
+        analyser._ensure_indexes()
+        failed_logins = analyser._failed_by_user.most_common()
         
         if not failed_logins:
             print("No failed logins to display.")
             return
             
-        users = [x[0] for x in failed_logins]
-        counts = [x[1] for x in failed_logins]
+        users, counts = zip(*failed_logins)
         
         plt.figure(figsize=(10, 6))
         bars = plt.bar(users, counts, color='crimson')
@@ -205,6 +293,8 @@ class LogView:
     @staticmethod
     def plot_login_timeline(analyser):
         """Plot login events over time."""
+        import matplotlib.pyplot as plt
+        import matplotlib.dates as mdates
         timeline = analyser.get_login_timeline()
         
         if not timeline:
@@ -212,8 +302,8 @@ class LogView:
             return
             
         # Extract data
-        timestamps = [event['timestamp'] for event in timeline]
-        event_types = [event['event_type'] for event in timeline]
+        timestamps = [event.timestamp for event in timeline]
+        event_types = [event.event_type for event in timeline]
         
         # Create figure
         plt.figure(figsize=(12, 6))
@@ -249,6 +339,7 @@ class LogView:
     @staticmethod
     def plot_event_distribution(analyser):
         """Plot distribution of event types."""
+        import matplotlib.pyplot as plt
         stats = analyser.get_event_statistics()
         event_counts = stats['event_counts']
         
@@ -289,20 +380,16 @@ class LogView:
     @staticmethod
     def plot_computer_activity(analyser):
         """Plot activity by computer."""
-        stats = analyser.get_event_statistics()
-        computer_activity = stats['computer_activity']
+        import matplotlib.pyplot as plt
+        # Counter.most_common() already sorts by activity count (descending)
+        analyser._ensure_indexes()
+        computer_activity = analyser._computer_activity.most_common()
         
         if not computer_activity:
             print("No computer activity data to display.")
             return
             
-        computers = list(computer_activity.keys())
-        counts = list(computer_activity.values())
-        
-        # Sort by activity count (descending)
-        sorted_data = sorted(zip(computers, counts), key=lambda x: x[1], reverse=True)
-        computers = [x[0] for x in sorted_data]
-        counts = [x[1] for x in sorted_data]
+        computers, counts = zip(*computer_activity)
         
         plt.figure(figsize=(10, 6))
         bars = plt.bar(computers, counts, color=plt.cm.viridis(np.linspace(0, 1, len(computers))))
@@ -327,6 +414,7 @@ class LogView:
     @staticmethod
     def plot_hourly_activity(analyser):
         """Plot login activity by hour of day."""
+        import matplotlib.pyplot as plt
         timeline = analyser.get_login_timeline()
         
         if not timeline:
@@ -339,9 +427,9 @@ class LogView:
         hour_failures = defaultdict(int)
         
         for event in timeline:
-            hour = event['timestamp'].hour
+            hour = event.timestamp.hour
             hour_counts[hour] += 1
-            if event['event_type'] == 'Success':
+            if event.event_type == 'Success':
                 hour_success[hour] += 1
             else:
                 hour_failures[hour] += 1
@@ -389,6 +477,10 @@ class SplunkIntegration:
             print("Splunk integration is disabled - skipping data transmission")
             self.error_reported = True
         return True
+        
+    def flush(self):
+        """Simulate sending any queued data to Splunk HEC."""
+        return True
 
 class Config:
     def __init__(self):
@@ -402,35 +494,37 @@ class Config:
             'index': 'windows_events'
         }
 
+# Sample data for generate_realistic_log, built once rather than per call
+_COMPUTERS = ('DC01', 'DC02', 'WS01', 'WS02', 'SRV01', 'SRV02', 'LAPTOP01', 'DESKTOP01')
+_NORMAL_USERS = ('user1@domain.com', 'admin@domain.com', 'service_acct@domain.com', 
+                 'backup_admin@domain.com', 'helpdesk@domain.com', 'john.doe@domain.com')
+_SUSPICIOUS_USERS = ('hacker@bad.com', 'test@domain.com', 'admin123@domain.com', 
+                     'root@domain.com', 'guest@domain.com', 'scanner@attack.com')
+_LOGON_TYPES = ('2', '3', '7', '10')
+_FAILURE_REASONS = ('0xC000006D', '0xC000006A', '0xC0000234', '0xC0000072')
+
 def generate_realistic_log(timestamp, event_type='4624', computer=None, user=None):
     """Generate a realistic log entry as a string."""
-    computers = ['DC01', 'DC02', 'WS01', 'WS02', 'SRV01', 'SRV02', 'LAPTOP01', 'DESKTOP01']
-    normal_users = ['user1@domain.com', 'admin@domain.com', 'service_acct@domain.com', 
-                   'backup_admin@domain.com', 'helpdesk@domain.com', 'john.doe@domain.com']
-    suspicious_users = ['hacker@bad.com', 'test@domain.com', 'admin123@domain.com', 
-                       'root@domain.com', 'guest@domain.com', 'scanner@attack.com']
-    
     if not computer:
-        computer = random.choice(computers)
+        computer = random.choice(_COMPUTERS)
     
     if not user:
         if event_type == '4625' and random.random() < 0.7:  # 70% chance of suspicious user for failed logins
-            user = random.choice(suspicious_users)
+            user = random.choice(_SUSPICIOUS_USERS)
         else:
-            user = random.choice(normal_users)
+            user = random.choice(_NORMAL_USERS)
     
     # Format timestamp as expected by the parser
-    time_str = timestamp.strftime('%Y%m%dT%H%M%SZ')
+    time_str = (f'{timestamp.year:04d}{timestamp.month:02d}{timestamp.day:02d}'
+                f'T{timestamp.hour:02d}{timestamp.minute:02d}{timestamp.second:02d}Z')
     
     # Additional fields based on event type
     additional = ''
     if event_type == '4624':  # Successful login
-        logon_types = ['2', '3', '7', '10']
-        logon_type = random.choice(logon_types)
+        logon_type = random.choice(_LOGON_TYPES)
         additional = f'LogonType={logon_type} AuthPackage=Kerberos'
     elif event_type == '4625':  # Failed login
-        failure_reasons = ['0xC000006D', '0xC000006A', '0xC0000234', '0xC0000072']
-        reason = random.choice(failure_reasons)
+        reason = random.choice(_FAILURE_REASONS)
         additional = f'FailureReason={reason} LogonType=3'
     elif event_type == '4672':  # Admin login
         additional = 'PrivilegeList=SeBackupPrivilege,SeRestorePrivilege'
@@ -439,6 +533,7 @@ def generate_realistic_log(timestamp, event_type='4624', computer=None, user=Non
 
 def generate_sample_logs(num_logs=100):
     """Generate a list of sample logs with realistic patterns."""
+    # (timestamp, log line) pairs, so sorting needs no string parsing
     logs = []
     
     # Start time for the log sequence
@@ -462,58 +557,82 @@ def generate_sample_logs(num_logs=100):
     # Add 5 failed attempts
     for i in range(5):
         timestamp = attack_time + datetime.timedelta(minutes=i*2)
-        logs.append(generate_realistic_log(timestamp, '4625', attack_computer, attack_user))
+        logs.append((timestamp, generate_realistic_log(timestamp, '4625', attack_computer, attack_user)))
     
     # Occasional success
     if random.random() < 0.3:  # 30% chance the attack "succeeds"
         timestamp = attack_time + datetime.timedelta(minutes=12)
-        logs.append(generate_realistic_log(timestamp, '4624', attack_computer, attack_user))
+        logs.append((timestamp, generate_realistic_log(timestamp, '4624', attack_computer, attack_user)))
     
     # 2. Unusual hour login (suspicious activity at 2-4 AM)
     unusual_time = start_time.replace(hour=random.randint(2, 4), minute=random.randint(0, 59))
-    logs.append(generate_realistic_log(unusual_time, '4624', 'SRV01', 'admin@domain.com'))
+    logs.append((unusual_time, generate_realistic_log(unusual_time, '4624', 'SRV01', 'admin@domain.com')))
     
     # 3. Admin activity
     admin_time = start_time + datetime.timedelta(hours=random.randint(9, 17))  # Business hours
-    logs.append(generate_realistic_log(admin_time, '4672', 'DC01', 'backup_admin@domain.com'))
-    
-    # Fill the rest with random events
-    remaining_logs = num_logs - len(logs)
-    for i in range(remaining_logs):
-        # Random time within the last 24 hours
-        hours_offset = random.randint(0, 23)
-        minutes_offset = random.randint(0, 59)
+    logs.append((admin_time, generate_realistic_log(admin_time, '4672', 'DC01', 'backup_admin@domain.com')))
+    
+    # Fill the rest with random events, drawing all offsets and event types at once
+    remaining_logs = max(num_logs - len(logs), 0)
+    rng = np.random.default_rng()
+    selected_events = rng.choice(list(event_types), size=remaining_logs,
+                                 p=list(event_types.values())).tolist()
+    # Random time within the last 24 hours
+    hours_offsets = rng.integers(0, 24, remaining_logs).tolist()
+    minutes_offsets = rng.integers(0, 60, remaining_logs).tolist()
+    
+    for selected_event, hours_offset, minutes_offset in zip(selected_events, hours_offsets, minutes_offsets):
         timestamp = start_time + datetime.timedelta(hours=hours_offset, minutes=minutes_offset)
-        
-        # Select event type based on probability distribution
-        rand = random.random()
-        cumulative = 0
-        selected_event = '4624'  # Default
-        for event, prob in event_types.items():
-            cumulative += prob
-            if rand <= cumulative:
-                selected_event = event
-                break
-        
-        logs.append(generate_realistic_log(timestamp, selected_event))
+        logs.append((timestamp, generate_realistic_log(timestamp, selected_event)))
     
     # Sort logs by timestamp
-    sorted_logs = sorted(logs, key=lambda x: x.split('TimeCreated=')[1].split(' ')[0])
+    logs.sort(key=lambda entry: entry[0])
     
-    return sorted_logs
+    return [log for _, log in logs]
+
+def _parse_chunk(lines):
+    """Parse raw log lines into LogRecords, dropping blank and unparsable ones."""
+    return list(filter(None, map(_parse_log_line, lines)))
+
+def _parse_file_parallel(f):
+    """Yield parsed entries from an open file, parsing chunks in worker processes."""
+    chunks = iter(lambda: list(islice(f, _PARSE_CHUNK_LINES)), [])
+    workers = os.cpu_count() or 1
+    # Bound the chunks in flight; executor.map would read the whole file up front
+    max_pending = 2 * workers
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunk in chunks:
+            pending.append(executor.submit(_parse_chunk, chunk))
+            if len(pending) >= max_pending:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+def _store_parsed(parsed_iter, storage, splunk=None):
+    """Store parsed entries and forward them to Splunk when enabled."""
+    if splunk and splunk.enabled:
+        # Keep the entries so they can be forwarded after storing
+        parsed_iter = list(parsed_iter)
+        storage.extend_logs(parsed_iter)
+        for parsed in parsed_iter:
+            splunk.send_to_hec(parsed.as_dict())
+        splunk.flush()
+    else:
+        storage.extend_logs(parsed_iter)
+
+def process_log_lines(lines, storage, splunk=None):
+    """Process an iterable of log lines and store parsed entries."""
+    _store_parsed(_parse_chunk(lines), storage, splunk)
 
 def process_log_file(file_path, storage, splunk=None):
     """Process a log file and store parsed entries."""
-    parser = LogParser()
     with open(file_path, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                parsed = parser.parse_line(line)
-                if parsed:
-                    storage.store_log(parsed)
-                    if splunk and splunk.enabled:
-                        splunk.send_to_hec(parsed)
+        if os.path.getsize(file_path) > _PARALLEL_PARSE_BYTES:
+            # Large files amortise the process start-up and pickling cost
+            _store_parsed(_parse_file_parallel(f), storage, splunk)
+        else:
+            process_log_lines(f, storage, splunk)
 
 def generate_alerts(analyser, splunk=None):
     """Generate security alerts based on log analysis."""
@@ -559,6 +678,9 @@ def generate_alerts(analyser, splunk=None):
                     "severity": "medium",
                     "type": "unusual_activity"
                 })
+    
+    if splunk and splunk.enabled:
+        splunk.flush()
 
 def main():
     """Main function to run the log analysis application."""
@@ -573,16 +695,10 @@ def main():
     # Generate sample logs
     sample_logs = generate_sample_logs(num_logs=100)
     
-    # Create temporary log file
-    log_file_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'sample_events.log')
-    with open(log_file_path, 'w') as f:
-        f.write('\n'.join(sample_logs))
-    
-    print(f"Log file created at: {log_file_path}")
     print("Processing logs...")
     
-    # Process the log file
-    process_log_file(log_file_path, storage, splunk)
+    # Process the generated lines directly, without a temporary log file
+    process_log_lines(sample_logs, storage, splunk)
     
     # Display analysis results
     print("\n=== Analysis Results ===")
@@ -627,7 +743,6 @@ def main():
     print("\nAnalysis complete! All visualizations have been saved as PNG files.")
     
     storage.close()
-    os.remove(log_file_path)
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -19,6 +19,8 @@ class Config:
         'username': 'admin',
         'password': 'yourpassword',
         'hec_token': 'your-hec-token',  # HTTP Event Collector token
+        'hec_port': 8088,  # HTTP Event Collector port
+        'hec_timeout': 10,  # Seconds before a HEC request is abandoned
         'index': 'windows_events'
     }
     
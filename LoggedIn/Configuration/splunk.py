@@ -1,6 +1,8 @@
 import splunklib.client as client
 from splunklib.client import Service
 from Program.Configuration.config import Config
+import http.client
+import json
 import time
 
 class SplunkIntegration:
@@ -8,6 +10,13 @@ class SplunkIntegration:
         self.config = config.SPLUNK
         self.service = None
         
+        # Events queued for the next HEC POST, as encoded envelopes
+        self._queue = []
+        self._batch_size = 500
+        self._envelope_suffixes = {}
+        # Kept open between POSTs so batches reuse one TLS connection
+        self._hec_conn = None
+        
         if self.config['enabled']:
             self.connect()
     
@@ -26,24 +35,81 @@ class SplunkIntegration:
             self.service = None
     
     def send_to_hec(self, event_data, sourcetype="windows:event"):
-        """Send data via HTTP Event Collector (HEC)"""
+        """Queue an event for the HTTP Event Collector (HEC), sending full batches"""
         if not self.config['enabled']:
             return False
         
+        event = json.dumps(event_data, default=str).encode()
+        self._queue.append(b'{"event":' + event + self._envelope_suffix(sourcetype))
+        # After a failed flush the queue keeps growing; retry once per batch
+        if len(self._queue) % self._batch_size == 0:
+            return self.flush()
+        return True
+    
+    def flush(self):
+        """Send all queued events in one HEC request"""
+        if not self._queue:
+            return True
+        
+        # Events stay queued until HEC accepts them, so a failed POST loses nothing
+        if not self._post_to_hec(b'\n'.join(self._queue)):
+            return False
+        self._queue.clear()
+        return True
+    
+    def send_batch_to_hec(self, events, sourcetype="windows:event"):
+        """Send many pre-serialized JSON events in one HEC request"""
+        if not self.config['enabled'] or not events:
+            return False
+        
+        # HEC accepts concatenated event envelopes in a single POST body, so
+        # each already-encoded event is wrapped without re-serializing it
+        suffix = self._envelope_suffix(sourcetype)
+        body = b'\n'.join(b'{"event":' + event + suffix for event in events)
+        return self._post_to_hec(body)
+    
+    def _envelope_suffix(self, sourcetype):
+        """Encoded HEC envelope fields that follow the event, cached per sourcetype"""
+        suffix = self._envelope_suffixes.get(sourcetype)
+        if suffix is None:
+            suffix = self._envelope_suffixes[sourcetype] = (',' + json.dumps({
+                'sourcetype': sourcetype,
+                'source': 'LoggedIn',
+                'index': self.config['index']
+            })[1:]).encode()
+        return suffix
+    
+    def _post_to_hec(self, body):
+        """POST an envelope body to HEC over the persistent connection"""
+        if self._hec_conn is None:
+            # Bounded so a hung endpoint cannot stall ingest, which flushes inline
+            self._hec_conn = http.client.HTTPSConnection(
+                self.config['host'], self.config['hec_port'],
+                timeout=self.config.get('hec_timeout', 10)
+            )
+        
         try:
-            # In a real implementation, you would use the HEC endpoint
-            # This is a simplified version using the SDK
-            index = self.service.indexes[self.config['index']]
-            index.submit(
-                event=event_data,
-                sourcetype=sourcetype,
-                source="LoggedIn"
+            self._hec_conn.request(
+                'POST', '/services/collector/event', body=body,
+                headers={'Authorization': f"Splunk {self.config['hec_token']}"}
             )
-            return True
+            response = self._hec_conn.getresponse()
+            response.read()  # Drain the response so the connection can be reused
+            return response.status == 200
         except Exception as e:
-            print(f"Failed to send to Splunk: {str(e)}")
+            print(f"Failed to send batch to Splunk: {str(e)}")
+            # Reconnect on the next POST rather than reuse a broken connection
+            self._hec_conn.close()
+            self._hec_conn = None
             return False
     
+    def close(self):
+        """Send any queued events and close the HEC connection"""
+        self.flush()
+        if self._hec_conn is not None:
+            self._hec_conn.close()
+            self._hec_conn = None
+    
     def search_failed_logins(self, earliest="-24h", latest="now"):
         """Search for failed login events in Splunk"""
         if not self.service:
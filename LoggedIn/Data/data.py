@@ -1,14 +1,59 @@
+import io
 import os
 import json
+import threading
 import matplotlib.pyplot as plt
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Callable
 from dataclasses import asdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import hashlib
 
+# orjson is several times faster than the stdlib encoder; fall back when absent
+try:
+    import orjson
+    
+    def _dumps_indented(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=str,
+                            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    def _dumps_indented(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, default=str).encode()
+
+def _write_json_atomic(path: str, obj: Any) -> None:
+    """Write obj as JSON to a temporary file, then rename it over path.
+    
+    Readers see either the previous file or the complete new one, never a
+    truncated write, without paying for an fsync per file. The temporary
+    name is unique per process and thread, so concurrent writers of one path
+    never share it, and it is removed if encoding or writing fails.
+    """
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(_dumps_indented(obj))
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+def _new_file_hasher():
+    """SHA256 for change detection only, so OpenSSL may use its fastest implementation."""
+    return hashlib.sha256(usedforsecurity=False)
+
 class DataManager:
-    def __init__(self, output_dir='data_results'):
+    # zlib level 3 encodes plot images several times faster than the default
+    # level 6 for only slightly larger files
+    PNG_OPTIONS = {'compress_level': 3}
+
+    def __init__(self, output_dir='data_results', dpi=150, storage=None):
         self.output_dir = output_dir
+        self.dpi = dpi
+        # Optional LogStorage that also records each saved visualization
+        self.storage = storage
         self.visualizations_dir = os.path.join(output_dir, 'visualizations')
         self.reports_dir = os.path.join(output_dir, 'reports')
         self._create_directories()
@@ -28,26 +73,65 @@ class DataManager:
         Returns:
             Dictionary containing saved visualization metadata
         """
+        metadata = self._write_visualization(visualization_result)
+        if metadata and self.storage is not None:
+            self.storage.store_visualization(
+                metadata['name'], metadata['filepath'], metadata['related_log_ids']
+            )
+        return metadata
+
+    def batch_save(self, visualizations: List[Any]) -> List[Dict[str, Any]]:
+        """Save many visualizations, recording them in one storage transaction.
+        
+        Args:
+            visualizations: VisualizationResult objects
+            
+        Returns:
+            Metadata of each saved visualization
+        """
+        saved = []
+        for visualization_result in visualizations:
+            metadata = self._write_visualization(visualization_result)
+            if metadata:
+                saved.append(metadata)
+
+        if self.storage is not None and saved:
+            self.storage.store_visualizations(
+                (m['name'], m['filepath'], m['related_log_ids']) for m in saved
+            )
+        return saved
+
+    def _write_visualization(self, visualization_result) -> Optional[Dict[str, Any]]:
+        """Write the PNG and JSON metadata files of one visualization."""
         if not visualization_result:
             return None
 
-        # Generate unique filename
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        # Generate unique filename; one clock read keeps it consistent with created_at
+        now = datetime.now()
+        timestamp = now.strftime('%Y%m%d_%H%M%S')
         filename = f"{visualization_result.name}_{timestamp}.png"
         filepath = os.path.join(self.visualizations_dir, filename)
 
-        # Save the figure
-        visualization_result.figure.savefig(filepath, dpi=300)
+        # Render the figure in memory so it is hashed without reading the file back
+        buffer = io.BytesIO()
+        visualization_result.figure.savefig(
+            buffer, format='png', dpi=self.dpi, bbox_inches=None, pil_kwargs=self.PNG_OPTIONS
+        )
         plt.close(visualization_result.figure)
+        png_data = buffer.getbuffer()
+        file_hash = _new_file_hasher()
+        file_hash.update(png_data)
+        with open(filepath, 'wb') as f:
+            f.write(png_data)
 
         # Create metadata
         metadata = {
             'name': visualization_result.name,
             'filepath': filepath,
             'description': visualization_result.description,
-            'created_at': datetime.now().isoformat(),
+            'created_at': now.isoformat(),
             'related_log_ids': visualization_result.related_log_ids,
-            'file_hash': self._calculate_file_hash(filepath)
+            'file_hash': file_hash.hexdigest()
         }
 
         # Save metadata
@@ -55,19 +139,49 @@ class DataManager:
             self.visualizations_dir,
             f"{visualization_result.name}_{timestamp}.json"
         )
-        with open(metadata_path, 'w') as f:
-            json.dump(metadata, f, indent=2)
+        _write_json_atomic(metadata_path, metadata)
 
         return metadata
 
     def _calculate_file_hash(self, filepath: str) -> str:
         """Calculate SHA256 hash of a file."""
-        hash_sha256 = hashlib.sha256()
         with open(filepath, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_sha256.update(chunk)
+            if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+                return hashlib.file_digest(f, _new_file_hasher).hexdigest()
+            
+            # Read 1 MiB at a time into one reusable buffer
+            hash_sha256 = _new_file_hasher()
+            buffer = bytearray(1 << 20)
+            view = memoryview(buffer)
+            while True:
+                size = f.readinto(buffer)
+                if not size:
+                    break
+                hash_sha256.update(view[:size])
         return hash_sha256.hexdigest()
 
+    def hash_files(self, paths: List[str]) -> Dict[str, str]:
+        """Calculate SHA256 hashes of many files concurrently.
+        
+        hashlib releases the GIL while digesting large buffers, so threads
+        hash separate files in parallel.
+        
+        Args:
+            paths: Paths of the files to hash
+            
+        Returns:
+            Dictionary mapping each path to its hex digest
+        """
+        hashes = {}
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            futures = {
+                executor.submit(self._calculate_file_hash, path): path
+                for path in paths
+            }
+            for future in as_completed(futures):
+                hashes[futures[future]] = future.result()
+        return hashes
+
     def save_analysis_results(self, results: Dict[str, Any], 
                             filename: Optional[str] = None) -> str:
         """Save analysis results with timestamp.
@@ -84,8 +198,7 @@ class DataManager:
             filename = f"analysis_results_{timestamp}.json"
 
         filepath = os.path.join(self.output_dir, filename)
-        with open(filepath, 'w') as f:
-            json.dump(results, f, indent=2, default=str)
+        _write_json_atomic(filepath, results)
 
         return filepath
 
@@ -100,89 +213,94 @@ class DataManager:
         Returns:
             Path to the generated report file
         """
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        report_lines = [
-            f"{report_type.capitalize()} Analysis Report - {timestamp}",
-            "=" * 80,
-            ""
-        ]
-
-        # Add executive summary for security reports
-        if report_type == 'security':
-            report_lines.extend(self._generate_security_summary(results))
-
-        # Add detailed findings
-        report_lines.extend(self._generate_detailed_findings(results, report_type))
-
-        # Add visualization references if available
-        if 'visualizations' in results:
-            report_lines.extend([
-                "",
-                "=== VISUALIZATIONS ===",
-                "The following visualizations were generated:"
-            ])
-            for viz in results['visualizations']:
-                report_lines.append(
-                    f"- {viz['name']}: {viz['description']} "
-                    f"(see {os.path.basename(viz['filepath'])})"
-                )
-
-        # Save report
-        filename = f"{report_type}_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+        now = datetime.now()
+        timestamp = now.strftime('%Y-%m-%d %H:%M:%S')
+        filename = f"{report_type}_report_{now.strftime('%Y%m%d_%H%M%S')}.txt"
         filepath = os.path.join(self.reports_dir, filename)
-        
+
+        # Stream each line into the buffered file rather than joining a list
         with open(filepath, 'w') as f:
-            f.write('\n'.join(report_lines))
+            write = f.write
+
+            def emit(line: str) -> None:
+                write(line)
+                write('\n')
+
+            emit(f"{report_type.capitalize()} Analysis Report - {timestamp}")
+            emit("=" * 80)
+            emit("")
+
+            # Add executive summary for security reports
+            if report_type == 'security':
+                self._generate_security_summary(results, emit)
+
+            # Add detailed findings
+            self._generate_detailed_findings(results, report_type, emit)
+
+            # Add visualization references if available
+            if 'visualizations' in results:
+                emit("")
+                emit("=== VISUALIZATIONS ===")
+                emit("The following visualizations were generated:")
+                for viz in results['visualizations']:
+                    emit(
+                        f"- {viz['name']}: {viz['description']} "
+                        f"(see {os.path.basename(viz['filepath'])})"
+                    )
 
         return filepath
 
-    def _generate_security_summary(self, results: Dict[str, Any]) -> List[str]:
-        """Generate security-specific summary section."""
-        summary = ["=== EXECUTIVE SUMMARY ==="]
+    def _generate_security_summary(self, results: Dict[str, Any],
+                                   emit: Callable[[str], None]) -> None:
+        """Emit the security-specific summary section."""
+        emit("=== EXECUTIVE SUMMARY ===")
         
         # Count critical findings
         critical_count = len(results.get('brute_force', {})) + \
                         len(results.get('suspicious_users', []))
         
-        summary.append(
+        emit(
             f"Found {critical_count} critical security events "
             f"and {len(results.get('failed_logins', []))} security warnings."
         )
         
         if critical_count > 0:
-            summary.append("\n[!] CRITICAL FINDINGS REQUIRE IMMEDIATE ATTENTION")
-        
-        return summary
+            emit("\n[!] CRITICAL FINDINGS REQUIRE IMMEDIATE ATTENTION")
 
     def _generate_detailed_findings(self, results: Dict[str, Any], 
-                                  report_type: str) -> List[str]:
-        """Generate detailed findings section based on report type."""
-        details = ["", "=== DETAILED FINDINGS ==="]
+                                  report_type: str,
+                                  emit: Callable[[str], None]) -> None:
+        """Emit the detailed findings section based on report type."""
+        emit("")
+        emit("=== DETAILED FINDINGS ===")
         
         if report_type == 'security':
             # Failed logins
             if results.get('failed_logins'):
-                details.append("\n[FAILED LOGIN ATTEMPTS]")
-                for user, count, _ in results['failed_logins']:
-                    details.append(f"- {user}: {count} attempts")
+                emit("\n[FAILED LOGIN ATTEMPTS]")
+                emit('\n'.join(
+                    f"- {user}: {count} attempts"
+                    for user, count, _ in results['failed_logins']
+                ))
 
             # Brute force
             if results.get('brute_force'):
-                details.append("\n[BRUTE FORCE ATTEMPTS]")
-                for user, attempts in results['brute_force'].items():
-                    details.append(f"- {user}: {attempts} failed attempts")
+                emit("\n[BRUTE FORCE ATTEMPTS]")
+                emit('\n'.join(
+                    f"- {user}: {attempts} failed attempts"
+                    for user, attempts in results['brute_force'].items()
+                ))
 
             # Suspicious users
             if results.get('suspicious_users'):
-                details.append("\n[SUSPICIOUS USERS]")
-                for user in results['suspicious_users']:
-                    details.append(f"- {user}")
+                emit("\n[SUSPICIOUS USERS]")
+                emit('\n'.join(f"- {user}" for user in results['suspicious_users']))
 
         # Add technical details for technical reports
         if report_type == 'technical':
             if results.get('event_stats'):
-                details.append("\n[EVENT STATISTICS]")
-                for event_id, count in results['event_stats'].items():
-                    details.append(f"- Event {event_id}: {count} occurrences")
-
-        return details
\ No newline at end of file
+                emit("\n[EVENT STATISTICS]")
+                emit('\n'.join(
+                    f"- Event {event_id}: {count} occurrences"
+                    for event_id, count in results['event_stats'].items()
+                ))
\ No newline at end of file
@@ -1,4 +1,3 @@
-from collections import defaultdict
 from datetime import datetime, timedelta
 import re
 from Program.Configuration.config import Config
@@ -7,62 +6,67 @@ class LogAnalyser:
     def __init__(self, storage):
         self.storage = storage
         self.config = Config()
+        self._failed_id = self.config.WINDOWS_EVENT_IDS['failed_login']
+        
+        # All suspicious patterns as one anchored alternation, evaluated by
+        # SQLite itself so non-matching rows never reach Python code
+        self._susp_re = re.compile(
+            '|'.join(f'(?:{p})' for p in self.config.ALERT_THRESHOLDS['suspicious_user_patterns']),
+            re.IGNORECASE
+        )
+        match = self._susp_re.match
+        self.storage.conn.create_function(
+            'susp', 1, lambda user: 1 if user and match(user) else 0, deterministic=True
+        )
     
     def count_failed_logins(self):
         cursor = self.storage.conn.cursor()
-        cursor.execute(f'''
+        cursor.execute('''
             SELECT user, COUNT(*) as count 
             FROM logs 
-            WHERE event_id = {self.config.WINDOWS_EVENT_IDS['failed_login']}
+            WHERE event_id = ?
             GROUP BY user 
             ORDER BY count DESC
-        ''')
+        ''', (self._failed_id,))
         return cursor.fetchall()
     
+    def event_stats(self):
+        """Count logs per event id, for the technical report's event_stats"""
+        # Grouping walks the event_id prefix of a covering composite index in order
+        cursor = self.storage.conn.cursor()
+        cursor.execute('''
+            SELECT event_id, COUNT(*)
+            FROM logs
+            GROUP BY event_id
+        ''')
+        return dict(cursor)
+    
     def detect_brute_force(self, window='5m', threshold=5):
         if window.endswith('m'):
             minutes = int(window[:-1])
             window_td = timedelta(minutes=minutes)
         
+        # Timestamps are stored as ISO strings, so the window is a range
+        # comparison and only per-user counts leave SQLite. The unary + stops
+        # the planner choosing idx_event_user_time just to satisfy GROUP BY,
+        # which would scan every failed login instead of the window range.
+        cutoff = (datetime.now() - window_td).isoformat()
         cursor = self.storage.conn.cursor()
-        cursor.execute(f'''
-            SELECT user, timestamp 
-            FROM logs 
-            WHERE event_id = {self.config.WINDOWS_EVENT_IDS['failed_login']}
-            ORDER BY timestamp
-        ''')
-        
-        brute_force_attempts = defaultdict(list)
-        now = datetime.now()
-        
-        for user, timestamp in cursor.fetchall():
-            if isinstance(timestamp, str):
-                try:
-                    timestamp = datetime.fromisoformat(timestamp)
-                except ValueError:
-                    continue
-            
-            if now - timestamp <= window_td:
-                brute_force_attempts[user].append(timestamp)
+        cursor.execute('''
+            SELECT user, COUNT(*)
+            FROM logs
+            WHERE event_id = ? AND timestamp >= ?
+            GROUP BY +user
+            HAVING COUNT(*) >= ?
+        ''', (self._failed_id, cutoff, threshold))
         
-        return {
-            user: len(attempts)
-            for user, attempts in brute_force_attempts.items()
-            if len(attempts) >= threshold
-        }
+        return dict(cursor)
     
     def detect_suspicious_users(self):
         """Detect users matching suspicious patterns"""
         cursor = self.storage.conn.cursor()
         cursor.execute('''
-            SELECT DISTINCT user FROM logs
+            SELECT DISTINCT user FROM logs WHERE susp(user) = 1
         ''')
         
-        suspicious_users = []
-        for (user,) in cursor.fetchall():
-            for pattern in self.config.ALERT_THRESHOLDS['suspicious_user_patterns']:
-                if re.match(pattern, user, re.IGNORECASE):
-                    suspicious_users.append(user)
-                    break
-        
-        return suspicious_users
\ No newline at end of file
+        return [user for (user,) in cursor]
\ No newline at end of file
@@ -1,29 +1,128 @@
 import re
 from datetime import datetime
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # pyarrow is optional; parse_batch falls back to parse_line
+    pa = None
+
+# Windows Event Log pattern, shared by the str, bytes and pyarrow paths
+_WINDOWS_EVENT_PATTERN = (
+    r'EventID=(?P<event_id>\d+)\s+'
+    r'TimeCreated=(?P<timestamp>\S+)\s+'
+    r'Computer=(?P<computer>\S+)\s+'
+    r'User=(?P<user>\S+)'
+)
+
+# RE2 leaves \v out of \s (and so in \S); spell out Python's ASCII classes
+_RE2_WINDOWS_EVENT_PATTERN = '^' + (
+    _WINDOWS_EVENT_PATTERN
+    .replace(r'\s', r'[ \t\n\r\f\v]')
+    .replace(r'\S', r'[^ \t\n\r\f\v]')
+)
+
+_WINDOWS_TIMESTAMP_FORMAT = '%Y%m%dT%H%M%SZ'
+
 class LogParser:
     def __init__(self):
-        # Windows Event Log pattern
-        self.windows_event_pattern = re.compile(
-            r'EventID=(?P<event_id>\d+)\s+'
-            r'TimeCreated=(?P<timestamp>\S+)\s+'
-            r'Computer=(?P<computer>\S+)\s+'
-            r'User=(?P<user>\S+)'
-        )
+        # ASCII classes so \d and \s agree with the bytes pattern and RE2
+        self.windows_event_pattern = re.compile(_WINDOWS_EVENT_PATTERN, re.ASCII)
+        # Same pattern for raw lines read in binary mode
+        self.windows_event_bytes_pattern = re.compile(_WINDOWS_EVENT_PATTERN.encode())
         
     def parse_line(self, line):
-        """Parse a single log line into structured data"""
+        """Parse a single log line (str or bytes) into structured data"""
+        if isinstance(line, bytes):
+            match = self.windows_event_bytes_pattern.match(line)
+            if not match:
+                return None
+            # Only the captured groups are decoded, never the whole line. UTF-8
+            # gives the same fields as the str path; bytes from other code pages
+            # (cp1252 exports) become U+FFFD instead of failing the line
+            event_id, timestamp, computer, user = match.groups()
+            return {
+                'event_id': int(event_id),
+                'timestamp': self._parse_windows_timestamp(timestamp.decode(errors='replace')),
+                'computer': computer.decode(errors='replace'),
+                'user': user.decode(errors='replace')
+            }
+        
         match = self.windows_event_pattern.match(line)
-        if match:
-            log_data = match.groupdict()
-            log_data['event_id'] = int(log_data['event_id'])
-            log_data['timestamp'] = self._parse_windows_timestamp(log_data['timestamp'])
-            return log_data
-        return None
+        if not match:
+            return None
+        # Positional groups into a dict literal beat groupdict() plus two updates
+        event_id, timestamp, computer, user = match.groups()
+        return {
+            'event_id': int(event_id),
+            'timestamp': self._parse_windows_timestamp(timestamp),
+            'computer': computer,
+            'user': user
+        }
+    
+    def parse_batch(self, lines):
+        """Parse many str lines at once into columns of parse_line's fields
+        
+        Unparsable lines are dropped. With pyarrow the regex, event id cast and
+        timestamp parsing run over the whole batch in Arrow's C++ kernels; rows
+        where Arrow and parse_line could disagree are finished in Python
+        """
+        if pa is None:
+            return self._parse_batch_lines(lines)
+        
+        # Anchored to behave like re.match; non-matching lines come back null
+        array = pa.array(lines, type=pa.string())
+        groups = pc.extract_regex(array, _RE2_WINDOWS_EVENT_PATTERN)
+        groups = groups.filter(pc.is_valid(groups))
+        try:
+            event_ids = pc.cast(groups.field('event_id'), pa.int64()).to_pylist()
+        except pa.ArrowInvalid:
+            # An event id beyond int64; Python ints have no such limit
+            return self._parse_batch_lines(array.to_pylist())
+        
+        raw_timestamps = groups.field('timestamp')
+        timestamps = pc.strptime(raw_timestamps, format=_WINDOWS_TIMESTAMP_FORMAT,
+                                 unit='s', error_is_null=True)
+        # Arrow rolls 12:00:60 over to 12:01 and rejects forms strptime allows
+        # (lowercase, short fields), so only round-tripped values are kept as is
+        exact = pc.fill_null(
+            pc.equal(pc.strftime(timestamps, format=_WINDOWS_TIMESTAMP_FORMAT), raw_timestamps),
+            False
+        )
+        return {
+            'event_id': event_ids,
+            'timestamp': [
+                timestamp if ok else self._parse_windows_timestamp(raw)
+                for timestamp, raw, ok in zip(
+                    timestamps.to_pylist(), raw_timestamps.to_pylist(), exact.to_pylist()
+                )
+            ],
+            'computer': groups.field('computer').to_pylist(),
+            'user': groups.field('user').to_pylist()
+        }
+    
+    def _parse_batch_lines(self, lines):
+        """Column-wise parse_batch result built one line at a time"""
+        columns = {'event_id': [], 'timestamp': [], 'computer': [], 'user': []}
+        for line in lines:
+            log_data = self.parse_line(line)
+            if log_data:
+                for key, column in columns.items():
+                    column.append(log_data[key])
+        return columns
     
     def _parse_windows_timestamp(self, timestamp_str):
         """Parse Windows Event timestamp into datetime object"""
+        # Fixed-width YYYYMMDDTHHMMSSZ is sliced directly; strptime handles the rest
+        s = timestamp_str
+        if (len(s) == 16 and s[8] == 'T' and s[15] == 'Z'
+                and s[:8].isdigit() and s[9:15].isdigit()):
+            try:
+                return datetime(int(s[0:4]), int(s[4:6]), int(s[6:8]),
+                                int(s[9:11]), int(s[11:13]), int(s[13:15]))
+            except ValueError:
+                pass
         try:
-            return datetime.strptime(timestamp_str, '%Y%m%dT%H%M%SZ')
+            return datetime.strptime(timestamp_str, _WINDOWS_TIMESTAMP_FORMAT)
         except ValueError:
             return timestamp_str
\ No newline at end of file
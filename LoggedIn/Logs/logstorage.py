@@ -1,18 +1,287 @@
+import io
+import os
+import queue
 import sqlite3
+import time
+from collections import Counter, deque
+from collections.abc import Mapping
+from contextlib import contextmanager
 from datetime import datetime
-from typing import List, Dict, Any, Optional, Tuple, Union
-import json
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple, Union, Callable, Iterable
+
+# orjson is several times faster than the stdlib encoder; fall back when absent
+try:
+    import orjson
+    
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    
+    def _dumps_bytes(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    
+    _loads = orjson.loads
+except ImportError:
+    import json
+    
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj)
+    
+    def _dumps_bytes(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+    
+    _loads = json.loads
+
+@lru_cache(maxsize=4096)
+def _parse_ts_fast(time_str: str) -> Optional[str]:
+    """Convert a fixed-width YYYYMMDDTHHMMSSZ timestamp to ISO format.
+    
+    Returns None when the string isn't in that form, so strptime fallbacks
+    and now() defaults never end up in the cache.
+    """
+    if (len(time_str) != 16 or time_str[8] != 'T' or time_str[15] != 'Z'
+            or not time_str[:8].isdigit() or not time_str[9:15].isdigit()):
+        return None
+    try:
+        return datetime(
+            int(time_str[0:4]), int(time_str[4:6]), int(time_str[6:8]),
+            int(time_str[9:11]), int(time_str[11:13]), int(time_str[13:15])
+        ).isoformat()
+    except ValueError:
+        return None
+
+def _text(value: Union[bytes, str, None]) -> Optional[str]:
+    return value.decode() if isinstance(value, bytes) else value
+
+def _json_or_none(value: Union[bytes, str, None]) -> Any:
+    return _loads(value) if value else None
+
+def _json_or_list(value: Union[bytes, str, None]) -> Any:
+    return _loads(value) if value else []
+
+class _LogRow(Mapping):
+    """Read-only mapping over a result row that converts columns lazily.
+    
+    JSON columns are only decoded when a caller reads them; the decoded
+    value is cached so repeated lookups don't parse again.
+    """
+    __slots__ = ('_row', '_converters', '_cache')
+    
+    def __init__(self, row: sqlite3.Row, converters: Dict[str, Callable[[Any], Any]]) -> None:
+        self._row = row
+        self._converters = converters
+        self._cache = {}
+    
+    def __getitem__(self, key: str) -> Any:
+        if key in self._cache:
+            return self._cache[key]
+        try:
+            value = self._row[key]
+        except IndexError:
+            raise KeyError(key) from None
+        
+        converter = self._converters.get(key)
+        if converter is not None:
+            value = self._cache[key] = converter(value)
+        return value
+    
+    def __iter__(self):
+        return iter(self._row.keys())
+    
+    def __len__(self) -> int:
+        return len(self._row)
+    
+    def __repr__(self) -> str:
+        return repr(dict(self))
 
 class LogStorage:
-    def __init__(self, db_path: str = 'event_logs.db') -> None:
+    # Number of read-only connections kept for the query methods
+    POOL_SIZE = 4
+    
+    # Forward pending logs to Splunk once this many are queued or the last
+    # flush was more than this many seconds ago
+    _flush_threshold = 100
+    _flush_interval = 2.0
+    # Oldest queued logs are dropped beyond this while Splunk is unreachable
+    _max_pending = 50000
+    
+    # Fields stored in dedicated columns; everything else goes to additional_info
+    _STANDARD_FIELDS = frozenset({
+        'EventID', 'TimeCreated', 'Computer', 'User', 
+        'LogonType', 'SourceIP', 'Status'
+    })
+    
+    # SQL kept as constants so every call hits sqlite3's statement cache
+    _SQL_INSERT_LOG = '''
+        INSERT INTO logs (
+            event_id, timestamp, computer, user,
+            logon_type, source_ip, status,
+            raw_text, additional_info
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    '''
+    _SQL_UPDATE_ANALYSIS = '''
+        UPDATE logs 
+        SET analysis_results = ?, processed = 1 
+        WHERE id = ?
+    '''
+    _SQL_INSERT_VIZ = '''
+        INSERT INTO visualizations (name, file_path, log_ids)
+        VALUES (?, ?, ?)
+    '''
+    _SQL_SELECT_VIZ = '''
+        SELECT id, name, file_path, created_at, log_ids
+        FROM visualizations
+        ORDER BY created_at DESC
+    '''
+    
+    # Log columns in schema order; raw_text/analysis_results are optional
+    # in get_log_details() since they are the large TEXT payloads
+    _LOG_COLUMNS = (
+        'id', 'event_id', 'timestamp', 'computer', 'user',
+        'logon_type', 'source_ip', 'status', 'raw_text',
+        'additional_info', 'processed', 'created_at', 'analysis_results'
+    )
+    
+    # Max bytes of serialized analysis shown per sample in generate_log_report()
+    _REPORT_ANALYSIS_LIMIT = 512
+    
+    # Key order of the entries rebuilt from the history columns
+    _HISTORY_FIELDS = (
+        'id', 'event_id', 'timestamp', 'computer', 'user',
+        'status', 'processed', 'analysis', '_cached_json'
+    )
+    
+    # Column conversions applied on first access by _LogRow. Readers return
+    # TEXT as raw bytes, so JSON columns are parsed without a str round-trip
+    _VIZ_CONVERTERS = {
+        'name': _text,
+        'file_path': _text,
+        'created_at': _text,
+        'log_ids': _json_or_list
+    }
+    _LOG_CONVERTERS = {
+        'event_id': _text,
+        'timestamp': _text,
+        'computer': _text,
+        'user': _text,
+        'logon_type': _text,
+        'source_ip': _text,
+        'status': _text,
+        'additional_info': _json_or_none,
+        'processed': bool,
+        'created_at': _text,
+        'analysis_results': _json_or_none
+    }
+    
+    def __init__(self, db_path: str = 'event_logs.db', splunk=None) -> None:
         """Initialize the log storage database with enhanced tracking.
         
         Args:
             db_path: Path to the SQLite database file
+            splunk: Optional SplunkIntegration that stored logs are
+                forwarded to in HEC batches
         """
-        self.conn = sqlite3.connect(db_path)
+        self.db_path = db_path
+        self.splunk = splunk
+        self._pending = deque(maxlen=self._max_pending)
+        self._queued_since_flush = 0
+        self._flush_failed = False
+        self._dropped = 0
+        self._last_flush = time.monotonic()
+        
+        # Autocommit mode: write batches manage their own BEGIN/COMMIT
+        self.conn = sqlite3.connect(
+            db_path,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=256
+        )
+        self.conn.executescript('''
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA mmap_size=268435456;
+            PRAGMA cache_size=-65536;
+        ''')
         self._create_tables()
-        self.log_history = []
+        
+        # Read-only connections so queries don't wait on the writer under WAL;
+        # an in-memory database is private to self.conn, so readers use that
+        self._ro_pool = queue.Queue()
+        self._ro_size = 0 if db_path == ':memory:' else self.POOL_SIZE
+        for _ in range(self._ro_size):
+            self._ro_pool.put(self._open_reader())
+        
+        # Processing history kept column-wise, one list per field
+        self._hist_ids: List[int] = []
+        self._hist_event_ids: List[Optional[str]] = []
+        self._hist_timestamps: List[str] = []
+        self._hist_computers: List[Optional[str]] = []
+        self._hist_users: List[Optional[str]] = []
+        self._hist_status: List[str] = []
+        self._hist_processed: List[bool] = []
+        self._hist_analysis: List[Optional[Dict[str, Any]]] = []
+        self._hist_json: List[bytes] = []
+        self._history_columns = (
+            self._hist_ids, self._hist_event_ids, self._hist_timestamps,
+            self._hist_computers, self._hist_users, self._hist_status,
+            self._hist_processed, self._hist_analysis, self._hist_json
+        )
+        self._history_pos: Dict[int, int] = {}
+    
+    def _open_reader(self) -> sqlite3.Connection:
+        """Open a read-only connection to the database file."""
+        uri = Path(os.path.abspath(self.db_path)).as_uri() + '?mode=ro'
+        conn = sqlite3.connect(
+            uri,
+            uri=True,
+            check_same_thread=False,
+            cached_statements=256
+        )
+        conn.row_factory = sqlite3.Row
+        conn.text_factory = bytes
+        conn.executescript('''
+            PRAGMA temp_store=MEMORY;
+            PRAGMA mmap_size=268435456;
+            PRAGMA cache_size=-65536;
+        ''')
+        return conn
+    
+    @contextmanager
+    def _ro(self):
+        """Check out a read-only connection from the pool."""
+        if not self._ro_size:
+            # Named rows on a cursor only; self.conn keeps returning tuples
+            # for the analyser queries that share it
+            cursor = self.conn.cursor()
+            cursor.row_factory = sqlite3.Row
+            try:
+                yield cursor
+            finally:
+                cursor.close()
+            return
+        
+        conn = self._ro_pool.get()
+        try:
+            yield conn
+        finally:
+            self._ro_pool.put(conn)
+    
+    @property
+    def log_history(self) -> List[Dict[str, Any]]:
+        """Processing history as a list of entry dictionaries.
+        
+        The entries are rebuilt from the history columns on each access,
+        so modifying them does not change the stored history.
+        """
+        return self._history_entries()
+    
+    def _history_entries(self, start: int = 0, stop: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Rebuild history entry dictionaries for the given position range."""
+        fields = self._HISTORY_FIELDS
+        columns = [column[start:stop] for column in self._history_columns]
+        return [dict(zip(fields, values)) for values in zip(*columns)]
     
     def _create_tables(self) -> None:
         """Create the required database tables if they don't exist."""
@@ -44,18 +313,38 @@ class LogStorage:
                 name TEXT NOT NULL,
                 file_path TEXT NOT NULL,
                 created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                log_ids TEXT  # JSON array of related log IDs
+                log_ids TEXT  -- JSON array of related log IDs
             )
         ''')
         
         # Create indexes
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_event_id ON logs(event_id)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_timestamp ON logs(timestamp)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_user ON logs(user)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_computer ON logs(computer)')
+        # user leads no composite index, so DISTINCT user scans need their own
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_user ON logs(user)')
+        # Failed-login / brute-force lookups filter by event and group by user
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_event_user_time ON logs(event_id, user, timestamp)')
+        # Hourly timeline scans a time range per event type
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_ts_event ON logs(timestamp, event_id)')
+        # Brute-force windows scan recent rows of one event; user makes it covering
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_logs_event_ts ON logs(event_id, timestamp, user)')
+        
+        # Superseded as leading prefixes of idx_event_user_time and idx_ts_event
+        cursor.execute('DROP INDEX IF EXISTS idx_event_id')
+        cursor.execute('DROP INDEX IF EXISTS idx_timestamp')
         
         self.conn.commit()
     
+    @contextmanager
+    def _transaction(self):
+        """Run the enclosed statements in one explicit transaction."""
+        self.conn.execute('BEGIN')
+        try:
+            yield self.conn
+        except BaseException:
+            self.conn.execute('ROLLBACK')
+            raise
+        self.conn.execute('COMMIT')
+    
     def store_log(self, log_data: Dict[str, Any]) -> Dict[str, Any]:
         """Store a parsed log entry with full tracking.
         
@@ -65,26 +354,114 @@ class LogStorage:
         Returns:
             Dictionary containing stored log info and status
         """
-        cursor = self.conn.cursor()
+        return self.store_logs([log_data])[0]
+    
+    def store_logs(self, logs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Store a batch of parsed log entries in a single transaction.
+        
+        Args:
+            logs: List of dictionaries containing parsed log data
+            
+        Returns:
+            List of dictionaries containing stored log info and status
+        """
+        # Serialize each log once; the same bytes feed raw_text and forwarders
+        blobs = [_dumps_bytes(log_data) for log_data in logs]
+        rows = [
+            self._row_from_log(log_data, blob)
+            for log_data, blob in zip(logs, blobs)
+        ]
+        if not rows:
+            return []
+        
+        with self._transaction() as conn:
+            conn.executemany(self._SQL_INSERT_LOG, rows)
+            # AUTOINCREMENT ids are contiguous within a single transaction
+            last_id = conn.execute('SELECT last_insert_rowid()').fetchone()[0]
+        
+        # Track in history
+        count = len(rows)
+        ids = range(last_id - count + 1, last_id + 1)
+        start = len(self._hist_ids)
+        
+        self._hist_ids.extend(ids)
+        self._hist_event_ids.extend(row[0] for row in rows)
+        self._hist_timestamps.extend(row[1] for row in rows)
+        self._hist_computers.extend(row[2] for row in rows)
+        self._hist_users.extend(row[3] for row in rows)
+        self._hist_status.extend(['stored'] * count)
+        self._hist_processed.extend([False] * count)
+        self._hist_analysis.extend([None] * count)
+        self._hist_json.extend(blobs)
+        self._history_pos.update(zip(ids, range(start, start + count)))
+        
+        if self.splunk is not None:
+            self._queue_pending(blobs)
+            # After a failed flush only a further batch of logs triggers a
+            # retry, so a down HEC endpoint isn't re-sent the backlog per call
+            if (self._queued_since_flush >= self._flush_threshold
+                    or (not self._flush_failed
+                        and time.monotonic() - self._last_flush > self._flush_interval)):
+                self.flush_pending()
+        
+        return self._history_entries(start)
+    
+    def _queue_pending(self, blobs: List[bytes]) -> None:
+        """Queue serialized logs for Splunk, dropping the oldest beyond _max_pending."""
+        dropped = len(self._pending) + len(blobs) - self._max_pending
+        if dropped > 0:
+            if not self._dropped:
+                print(f"Warning: Splunk backlog reached {self._max_pending} logs; "
+                      f"dropping the oldest until a flush succeeds")
+            self._dropped += dropped
+        self._pending.extend(blobs)
+        self._queued_since_flush += len(blobs)
+    
+    def flush_pending(self) -> bool:
+        """Forward all queued logs to Splunk in a single HEC batch.
+        
+        Returns:
+            True if there was nothing to send or the batch was accepted;
+            on failure the logs stay queued
+        """
+        self._last_flush = time.monotonic()
+        self._queued_since_flush = 0
+        if not self._pending:
+            return True
+        
+        events = list(self._pending)
+        if self.splunk.send_batch_to_hec(events):
+            self._pending.clear()
+            if self._dropped:
+                print(f"Warning: {self._dropped} logs were dropped from the Splunk backlog")
+                self._dropped = 0
+            self._flush_failed = False
+            return True
+        
+        # Keep a failed batch for the next flush; only drop it when the
+        # integration is switched off and it could never be sent
+        self._flush_failed = True
+        if not self.splunk.config['enabled']:
+            self._pending.clear()
+        return False
+    
+    def _row_from_log(self, log_data: Dict[str, Any], raw_json: bytes) -> Tuple:
+        """Build the INSERT parameters for a single parsed log entry.
+        
+        Args:
+            log_data: Dictionary containing parsed log data
+            raw_json: The log already serialized as JSON
+        """
         timestamp = self._parse_timestamp(log_data.get('TimeCreated'))
         
         # Prepare additional fields
-        standard_fields = {
-            'EventID', 'TimeCreated', 'Computer', 'User', 
-            'LogonType', 'SourceIP', 'Status'
-        }
+        standard_fields = self._STANDARD_FIELDS
         additional_info = {
             k: v for k, v in log_data.items() 
             if k not in standard_fields
         }
         
-        cursor.execute('''
-            INSERT INTO logs (
-                event_id, timestamp, computer, user,
-                logon_type, source_ip, status,
-                raw_text, additional_info
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
+        return (
             log_data.get('EventID'),
             timestamp,
             log_data.get('Computer'),
@@ -92,27 +469,9 @@ class LogStorage:
             log_data.get('LogonType'),
             log_data.get('SourceIP'),
             log_data.get('Status'),
-            str(log_data),
-            json.dumps(additional_info) if additional_info else None
-        ))
-        
-        self.conn.commit()
-        log_id = cursor.lastrowid
-        
-        # Track in history
-        log_entry = {
-            'id': log_id,
-            'event_id': log_data.get('EventID'),
-            'timestamp': timestamp,
-            'computer': log_data.get('Computer'),
-            'user': log_data.get('User'),
-            'status': 'stored',
-            'processed': False,
-            'analysis': None
-        }
-        self.log_history.append(log_entry)
-        
-        return log_entry
+            raw_json,  # stored as-is; callers decode on demand
+            _dumps(additional_info) if additional_info else None
+        )
     
     def update_log_analysis(self, log_id: int, analysis_results: Dict[str, Any]) -> bool:
         """Update log with analysis results.
@@ -127,21 +486,19 @@ class LogStorage:
         cursor = self.conn.cursor()
         
         try:
-            cursor.execute('''
-                UPDATE logs 
-                SET analysis_results = ?, processed = 1 
-                WHERE id = ?
-            ''', (json.dumps(analysis_results), log_id))
+            cursor.execute(
+                self._SQL_UPDATE_ANALYSIS,
+                (_dumps(analysis_results), log_id)
+            )
             
             self.conn.commit()
             
             # Update history
-            for entry in self.log_history:
-                if entry['id'] == log_id:
-                    entry['analysis'] = analysis_results
-                    entry['status'] = 'analyzed'
-                    entry['processed'] = True
-                    break
+            pos = self._history_pos.get(log_id)
+            if pos is not None:
+                self._hist_analysis[pos] = analysis_results
+                self._hist_status[pos] = 'analyzed'
+                self._hist_processed[pos] = True
             
             return True
         except sqlite3.Error:
@@ -161,13 +518,10 @@ class LogStorage:
         cursor = self.conn.cursor()
         
         try:
-            cursor.execute('''
-                INSERT INTO visualizations (name, file_path, log_ids)
-                VALUES (?, ?, ?)
-            ''', (
+            cursor.execute(self._SQL_INSERT_VIZ, (
                 name,
                 file_path,
-                json.dumps(related_log_ids) if related_log_ids else None
+                _dumps(related_log_ids) if related_log_ids else None
             ))
             
             self.conn.commit()
@@ -175,62 +529,86 @@ class LogStorage:
         except sqlite3.Error:
             return False
     
-    def get_visualizations(self) -> List[Dict[str, Any]]:
-        """Get all stored visualizations.
+    def store_visualizations(self, visualizations: Iterable[Tuple[str, str, Optional[List[int]]]]) -> bool:
+        """Store metadata of many visualizations in a single transaction.
         
+        Args:
+            visualizations: (name, file_path, related_log_ids) tuples
+            
         Returns:
-            List of visualization metadata dictionaries
+            True if storage was successful
         """
-        cursor = self.conn.cursor()
-        cursor.execute('SELECT * FROM visualizations ORDER BY created_at DESC')
-        return [
-            {
-                'id': row[0],
-                'name': row[1],
-                'file_path': row[2],
-                'created_at': row[3],
-                'log_ids': json.loads(row[4]) if row[4] else []
-            }
-            for row in cursor.fetchall()
+        rows = [
+            (name, file_path, _dumps(related_log_ids) if related_log_ids else None)
+            for name, file_path, related_log_ids in visualizations
         ]
+        
+        try:
+            with self._transaction() as conn:
+                conn.executemany(self._SQL_INSERT_VIZ, rows)
+            return True
+        except sqlite3.Error:
+            return False
     
-    def get_log_details(self, log_id: int) -> Dict[str, Any]:
+    def get_visualizations(self) -> List[Mapping[str, Any]]:
+        """Get all stored visualizations.
+        
+        Returns:
+            List of visualization metadata mappings; log_ids is decoded
+            on first access
+        """
+        with self._ro() as conn:
+            rows = conn.execute(self._SQL_SELECT_VIZ).fetchall()
+        converters = self._VIZ_CONVERTERS
+        return [_LogRow(row, converters) for row in rows]
+    
+    def get_log_details(self, log_id: int, *, include_raw: bool = False,
+                        include_analysis: bool = True) -> Optional[Mapping[str, Any]]:
         """Get complete details for a specific log.
         
         Args:
             log_id: ID of the log to retrieve
+            include_raw: Also select the raw_text column
+            include_analysis: Also select the analysis_results column
             
         Returns:
-            Dictionary with all log details and analysis
+            Mapping with the selected log details; JSON columns are decoded
+            on first access and raw_text is the stored JSON bytes
         """
-        cursor = self.conn.cursor()
-        cursor.execute('SELECT * FROM logs WHERE id = ?', (log_id,))
-        row = cursor.fetchone()
+        sql = self._select_log_sql(include_raw, include_analysis)
+        with self._ro() as conn:
+            row = conn.execute(sql, (log_id,)).fetchone()
         
         if not row:
             return None
             
-        return {
-            'id': row[0],
-            'event_id': row[1],
-            'timestamp': row[2],
-            'computer': row[3],
-            'user': row[4],
-            'logon_type': row[5],
-            'source_ip': row[6],
-            'status': row[7],
-            'raw_text': row[8],
-            'additional_info': json.loads(row[9]) if row[9] else None,
-            'processed': bool(row[10]),
-            'created_at': row[11],
-            'analysis_results': json.loads(row[12]) if row[12] else None
-        }
+        return _LogRow(row, self._LOG_CONVERTERS)
+    
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _select_log_sql(cls, include_raw: bool, include_analysis: bool) -> str:
+        """Build the log SELECT once per column combination.
+        
+        Returning the identical string for each combination keeps the
+        prepared-statement cache effective.
+        """
+        skipped = set()
+        if not include_raw:
+            skipped.add('raw_text')
+        if not include_analysis:
+            skipped.add('analysis_results')
+        columns = ', '.join(c for c in cls._LOG_COLUMNS if c not in skipped)
+        return f'SELECT {columns} FROM logs WHERE id = ?'
     
     def _parse_timestamp(self, time_str: Optional[str]) -> str:
         """Parse and format timestamp string."""
         if not time_str:
             return datetime.now().isoformat()
         
+        iso = _parse_ts_fast(time_str)
+        if iso is not None:
+            return iso
+        
         try:
             dt = datetime.strptime(time_str, '%Y%m%dT%H%M%SZ')
             return dt.isoformat()
@@ -243,36 +621,47 @@ class LogStorage:
         Returns:
             Formatted string report
         """
-        report = ["=== LOG PROCESSING REPORT ==="]
-        report.append(f"Total logs processed: {len(self.log_history)}")
-        report.append(f"First log timestamp: {self.log_history[0]['timestamp']}")
-        report.append(f"Last log timestamp: {self.log_history[-1]['timestamp']}")
-        report.append("\nProcessing Summary:")
-        
-        status_counts = {}
-        for entry in self.log_history:
-            status_counts[entry['status']] = status_counts.get(entry['status'], 0) + 1
-        
-        for status, count in status_counts.items():
-            report.append(f"- {status}: {count} logs")
-        
-        report.append("\nSample Log Details:")
-        for entry in self.log_history[:5]:  # Show first 5 as sample
-            report.append(
-                f"\n[Log ID: {entry['id']}] {entry['event_id']} @ {entry['timestamp']}\n"
+        if not self._hist_ids:
+            return "=== LOG PROCESSING REPORT ===\n(no logs)"
+        
+        buf = io.StringIO()
+        w = buf.write
+        w("=== LOG PROCESSING REPORT ===\n")
+        w(f"Total logs processed: {len(self._hist_ids)}\n")
+        w(f"First log timestamp: {self._hist_timestamps[0]}\n")
+        w(f"Last log timestamp: {self._hist_timestamps[-1]}\n")
+        w("\nProcessing Summary:")
+        
+        for status, count in Counter(self._hist_status).items():
+            w(f"\n- {status}: {count} logs")
+        
+        w("\n\nSample Log Details:")
+        limit = self._REPORT_ANALYSIS_LIMIT
+        for entry in self._history_entries(0, 5):  # Show first 5 as sample
+            w(
+                f"\n\n[Log ID: {entry['id']}] {entry['event_id']} @ {entry['timestamp']}\n"
                 f"Computer: {entry['computer']}\n"
                 f"User: {entry['user']}\n"
                 f"Status: {entry['status']}"
             )
             if entry['analysis']:
-                report.append(f"Analysis: {json.dumps(entry['analysis'], indent=2)}")
+                # Informational only: compact and capped, never pretty-printed
+                analysis = _dumps_bytes(entry['analysis'])
+                suffix = '...' if len(analysis) > limit else ''
+                w(f"\nAnalysis: {analysis[:limit].decode('utf-8', 'ignore')}{suffix}")
         
-        return "\n".join(report)
+        return buf.getvalue()
     
     def close(self) -> None:
-        """Close the database connection and clean up."""
+        """Close the database connections and clean up."""
+        if self.splunk is not None:
+            self.flush_pending()
+        while not self._ro_pool.empty():
+            self._ro_pool.get_nowait().close()
         self.conn.close()
-        self.log_history.clear()
+        for column in self._history_columns:
+            column.clear()
+        self._history_pos.clear()
     
     def __enter__(self):
         return self
@@ -305,8 +694,7 @@ if __name__ == '__main__':
         ]
         
         print("Storing test logs...")
-        for log in test_logs:
-            storage.store_log(log)
+        storage.store_logs(test_logs)
         
         print("\nDatabase contents:")
         storage.print_recent_logs()
@@ -1,8 +1,10 @@
 import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.figure import Figure
 from typing import List, Tuple, Dict, Any
 from datetime import datetime
 from dataclasses import dataclass
+from itertools import chain
 
 @dataclass
 class VisualizationResult:
@@ -12,7 +14,7 @@ class VisualizationResult:
     related_log_ids: List[int]
 
 class LogView:
-    def __init__(self, data_manager):
+    def __init__(self, data_manager, reuse_figures=False):
         self.data_manager = data_manager
         self.style_settings = {
             'title_fontsize': 16,
@@ -25,6 +27,24 @@ class LogView:
                 'neutral': '#adb5bd'
             }
         }
+        # Opt-in for redraw loops: one Figure/Axes per plot type, cleared
+        # between renders. A returned VisualizationResult is then only valid
+        # until the next call for the same plot type, so save it first.
+        self.reuse_figures = reuse_figures
+        self._figures = {}
+
+    def _axes(self, name, figsize):
+        """Return a figure and an empty Axes for a plot type."""
+        if not self.reuse_figures:
+            # Not registered with pyplot, so no GUI manager is created for it
+            fig = Figure(figsize=figsize)
+            return fig, fig.add_subplot()
+        if name not in self._figures:
+            fig = Figure(figsize=figsize)
+            self._figures[name] = (fig, fig.add_subplot())
+        fig, ax = self._figures[name]
+        ax.cla()
+        return fig, ax
 
     def plot_failed_logins(self, analyser) -> VisualizationResult:
         """Plot failed login attempts by user."""
@@ -34,19 +54,17 @@ class LogView:
             return None
 
         users = [item[0] for item in data]
-        counts = [item[1] for item in data]
+        counts = np.asarray([item[1] for item in data], dtype=np.int64)
         related_log_ids = [item[2] for item in data]  # Assuming analyser returns log IDs
 
-        fig = plt.figure(figsize=(12, 6))
-        bars = plt.bar(users, counts, color=self.style_settings['colors']['failure'])
+        fig, ax = self._axes('failed_logins', figsize=(12, 6))
+        bars = ax.bar(users, counts, color=self.style_settings['colors']['failure'])
 
-        # Add value labels
-        for bar in bars:
-            height = bar.get_height()
-            plt.text(bar.get_x() + bar.get_width()/2., height,
-                    f'{int(height)}', ha='center', va='bottom')
+        # Add value labels in one call rather than one text artist per bar
+        ax.bar_label(bars, labels=[str(count) for count in counts.tolist()], padding=2)
 
         self._apply_style(
+            ax,
             title='Failed Login Attempts by User',
             xlabel='Username',
             ylabel='Failed Attempts'
@@ -66,30 +84,33 @@ class LogView:
             print("No timeline data to display")
             return None
 
-        # Process timeline data
-        hours = []
-        success_counts = []
-        failure_counts = []
-        related_log_ids = []
-        
-        for hour_data in timeline_data:
-            hours.append(hour_data['hour'])
-            success_counts.append(hour_data['success_count'])
-            failure_counts.append(hour_data['failure_count'])
-            related_log_ids.extend(hour_data['related_log_ids'])
+        # Process timeline data into typed columns in a single pass
+        timeline = np.array(
+            [
+                (hour_data['hour'], hour_data['success_count'], hour_data['failure_count'])
+                for hour_data in timeline_data
+            ],
+            dtype=[('hour', object), ('success', np.int64), ('failure', np.int64)]
+        )
+        hours = timeline['hour']
+        success_counts = timeline['success']
+        failure_counts = timeline['failure']
+        related_log_ids = list(chain.from_iterable(
+            hour_data['related_log_ids'] for hour_data in timeline_data
+        ))
 
-        fig = plt.figure(figsize=(14, 6))
+        fig, ax = self._axes('login_timeline', figsize=(14, 6))
         bar_width = 0.35
         index = np.arange(len(hours))
 
-        plt.bar(
+        ax.bar(
             index, 
             success_counts, 
             bar_width, 
             label='Successful Logins', 
             color=self.style_settings['colors']['success']
         )
-        plt.bar(
+        ax.bar(
             index + bar_width, 
             failure_counts, 
             bar_width, 
@@ -98,6 +119,7 @@ class LogView:
         )
 
         self._apply_style(
+            ax,
             title='Login Activity by Hour',
             xlabel='Hour of Day',
             ylabel='Number of Logins',
@@ -113,39 +135,39 @@ class LogView:
             related_log_ids=related_log_ids
         )
 
-    def _apply_style(self, **kwargs):
-        """Apply consistent styling to plots."""
+    def _apply_style(self, ax, **kwargs):
+        """Apply consistent styling to a plot's Axes."""
         if 'title' in kwargs:
-            plt.title(
+            ax.set_title(
                 kwargs['title'],
                 pad=20,
                 fontsize=self.style_settings['title_fontsize']
             )
         
         if 'xlabel' in kwargs:
-            plt.xlabel(
+            ax.set_xlabel(
                 kwargs['xlabel'],
                 labelpad=10,
                 fontsize=self.style_settings['label_fontsize']
             )
         
         if 'ylabel' in kwargs:
-            plt.ylabel(
+            ax.set_ylabel(
                 kwargs['ylabel'],
                 labelpad=10,
                 fontsize=self.style_settings['label_fontsize']
             )
         
         if 'xticks' in kwargs and 'xticklabels' in kwargs:
-            plt.xticks(
-                kwargs['xticks'],
+            ax.set_xticks(kwargs['xticks'])
+            ax.set_xticklabels(
                 kwargs['xticklabels'],
                 rotation=45,
                 fontsize=self.style_settings['tick_fontsize']
             )
         
         if kwargs.get('legend'):
-            plt.legend(fontsize=self.style_settings['label_fontsize'])
+            ax.legend(fontsize=self.style_settings['label_fontsize'])
         
-        plt.grid(axis='y', linestyle='--', alpha=0.7)
-        plt.tight_layout()
\ No newline at end of file
+        ax.grid(axis='y', linestyle='--', alpha=0.7)
+        ax.figure.tight_layout()
\ No newline at end of file